@@ -30,11 +30,17 @@ input(
     f"{ph_link}\n has been appended to at the back.\nPlease check\nPress CTRL+C to exit.\nOr press Enter to continue to display the page content...\n"
 )
 
-import json
+try:
+    import orjson
 
+    def print_json(data):
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
-def print_json(data):
-    print(json.dumps(data, indent=4, ensure_ascii=False))
+except ImportError:  # orjson is an optional dependency
+    import json
+
+    def print_json(data):
+        print(json.dumps(data, indent=4, ensure_ascii=False))
 
 
 print_json(ph.get_page(ph_link))
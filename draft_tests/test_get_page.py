@@ -5,11 +5,17 @@ from ytelegraph import TelegraphAPI
 
 ph = TelegraphAPI()
 
-import json
+try:
+    import orjson
 
+    def print_json(data):
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
-def print_json(data):
-    print(json.dumps(data, indent=4, ensure_ascii=False))
+except ImportError:  # orjson is an optional dependency
+    import json
+
+    def print_json(data):
+        print(json.dumps(data, indent=4, ensure_ascii=False))
 
 
 get_path = ph.get_page("Answer-it-07-16-3")
@@ -22,9 +28,9 @@ get_link = ph.get_page("https://telegra.ph/Answer-it-07-16-2")
 
 print_json(get_link)
 
-input("Press Enter to continue...\nNext is max_retries and retry_delay. Should fail\n")
+input("Press Enter to continue...\nNext is a missing page. Should fail\n")
 
-get_fail = ph.get_page("your-page-path", max_retries=3, retry_delay=0.1)
+get_fail = ph.get_page("your-page-path")
 
 print(get_fail)
 
@@ -1,8 +1,14 @@
-import json
+try:
+    import orjson
 
+    def print_json(data):
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
-def print_json(data):
-    print(json.dumps(data, indent=4, ensure_ascii=False))
+except ImportError:  # orjson is an optional dependency
+    import json
+
+    def print_json(data):
+        print(json.dumps(data, indent=4, ensure_ascii=False))
 
 
 from ytelegraph import md_to_dom, TelegraphAPI
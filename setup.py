@@ -1,4 +1,38 @@
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+class OptionalBuildExt(build_ext):
+    """Builds the Cython extensions, falling back to pure Python on failure."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            print(f"WARNING: C extensions not built, using pure Python: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"WARNING: {ext.name} not built, using pure Python: {e}")
+
+
+ext_modules = (
+    cythonize(
+        ["ytelegraph/md_to_dom.py"],
+        language_level="3",
+        # Accept str subclasses, as the pure Python module does.
+        compiler_directives={"annotation_typing": False},
+    )
+    if cythonize
+    else []
+)
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -13,11 +47,17 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/alterxyz/ytelegraph",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt},
     install_requires=[
         "requests",
-        "beautifulsoup4",
-        "Markdown",
+        "mistletoe>=1.1.0",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "msgspec": ["msgspec"],
+        "orjson": ["orjson"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
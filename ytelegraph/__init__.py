@@ -3,3 +3,11 @@ from .account import TelegraphAccount
 from .md_to_dom import md_to_dom
 
 __all__ = ["TelegraphAPI", "TelegraphAccount", "md_to_dom"]
+
+try:
+    from .async_account import AsyncTelegraphAccount
+    from .async_api import AsyncTelegraphAPI
+except ImportError:  # aiohttp is an optional dependency
+    pass
+else:
+    __all__ += ["AsyncTelegraphAPI", "AsyncTelegraphAccount"]
@@ -0,0 +1,27 @@
+from typing import Any
+
+try:
+    import msgspec
+
+    _encoder = msgspec.json.Encoder()
+    loads = msgspec.json.decode
+
+    def dumps(obj: Any) -> str:
+        return _encoder.encode(obj).decode()
+
+except ImportError:  # msgspec is an optional dependency
+    try:
+        import orjson
+
+        loads = orjson.loads
+
+        def dumps(obj: Any) -> str:
+            return orjson.dumps(obj).decode()
+
+    except ImportError:  # orjson is an optional dependency
+        import json
+
+        loads = json.loads
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
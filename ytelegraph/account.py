@@ -1,10 +1,19 @@
-import json
 import os
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Final
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+from ._json import dumps, loads
+
+_BASE_URL: Final[str] = "https://api.telegra.ph"
+_URL_CREATE_ACCOUNT: Final[str] = _BASE_URL + "/createAccount"
+_URL_GET_ACCOUNT_INFO: Final[str] = _BASE_URL + "/getAccountInfo"
+_URL_REVOKE_ACCESS_TOKEN: Final[str] = _BASE_URL + "/revokeAccessToken"
+_URL_EDIT_ACCOUNT_INFO: Final[str] = _BASE_URL + "/editAccountInfo"
 
 
 class TelegraphAccount:
@@ -18,12 +27,28 @@ class TelegraphAccount:
 
     Attributes:
         TOKEN_FILENAME (str): The default filename for storing the access token.
+        ACCOUNT_INFO_FIELDS (list): The fields fetched for the account properties.
+        REQUEST_TIMEOUT (float): The timeout in seconds for connecting to and
+            reading from the Telegraph API.
         access_token (str): The access token for the Telegraph account.
-        base_url (str): The base URL for the Telegraph API.
+        base_url (str): The base URL for the Telegraph API. Kept for
+            reference only; requests use the module-level endpoint URLs.
         short_name (str): The short name of the Telegraph account.
         author_name (str): The author name associated with the account.
         author_url (str): The author URL associated with the account.
 
+    Note:
+        All requests share one `requests.Session`, so the connection to the
+        Telegraph API is kept alive between calls. Connection errors are
+        retried with exponential backoff on that connection pool, as are
+        read errors and gateway errors (502, 503, 504) of GET requests.
+        Use the account as a context manager, or call `close`, to release
+        it.
+
+        `short_name`, `author_name` and `author_url` are fetched lazily on
+        first access. A freshly created account reuses the `createAccount`
+        response, so no extra request is made.
+
     Example:
         >>> account = TelegraphAccount()
         >>> print(account.short_name)  # Output: Your Name
@@ -31,7 +56,19 @@ class TelegraphAccount:
         >>> print(account.author_name)  # Output: New Author Name
     """
 
+    __slots__ = (
+        "access_token",
+        "base_url",
+        "_session",
+        "_account_info_cache",
+        "_default_account_info",
+        "_token_file_path",
+        "_token_dir_ready",
+    )
+
     TOKEN_FILENAME: str = "ph_token.txt"
+    ACCOUNT_INFO_FIELDS: List[str] = ["short_name", "author_name", "author_url"]
+    REQUEST_TIMEOUT: float = 30.0
 
     def __init__(
         self,
@@ -53,19 +90,108 @@ class TelegraphAccount:
             author_url: The author URL associated with the account.
                 Only used when creating a new account. Defaults to None.
         """
-        self.base_url: str = "https://api.telegra.ph"
-        self.access_token: str = (
-            access_token
-            or self._get_token()
-            or self._create_account(short_name, author_name, author_url)
+        self.base_url: str = _BASE_URL
+        self._session: requests.Session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.25,
+                    status_forcelist=(502, 503, 504),
+                    # A POST may already have been processed when the read
+                    # fails or a gateway error is returned, and retrying it
+                    # could create a duplicate page or lose a revoked token.
+                    # Only connection errors are retried for POST.
+                    allowed_methods=frozenset({"GET"}),
+                ),
+            ),
         )
-        account_info: Dict[str, Any] = self.get_account_info()
-        self.short_name: str = account_info.get("short_name", short_name)
-        self.author_name: str = account_info.get("author_name", author_name)
-        self.author_url: Optional[str] = account_info.get("author_url", author_url)
+        self._account_info_cache: Optional[Dict[str, Any]] = None
+        self._default_account_info: Dict[str, Any] = {
+            "short_name": short_name,
+            "author_name": author_name,
+            "author_url": author_url,
+        }
+        self._token_file_path: Path = self._resolve_token_file_path()
+        self._token_dir_ready: bool = False
+        self.access_token: str = access_token or self._get_token()
+        if not self.access_token:
+            self.access_token = self._create_account(
+                short_name, author_name, author_url
+            ).get("access_token")
 
-    def _get_token_file_path(self) -> Path:
-        """Gets the path to the access token file.
+    def __enter__(self) -> "TelegraphAccount":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def _cached_account_info(self) -> Dict[str, Any]:
+        """Gets the account information, fetching it on first use.
+
+        A failed fetch is not cached, so it is retried on the next access.
+
+        Returns:
+            dict: The cached account information, or an empty dictionary if
+                it could not be fetched.
+        """
+        if self._account_info_cache is None:
+            account_info: Dict[str, Any] = self.get_account_info(
+                fields=self.ACCOUNT_INFO_FIELDS
+            )
+            if not account_info:
+                return account_info
+            self._account_info_cache = account_info
+        return self._account_info_cache
+
+    def _get_account_field(self, field: str) -> Any:
+        """Gets a field of the account information.
+
+        Args:
+            field: The name of the field.
+
+        Returns:
+            The field value, or the value given at initialization if the
+            API did not return it.
+        """
+        return self._cached_account_info().get(field, self._default_account_info[field])
+
+    @property
+    def short_name(self) -> str:
+        """str: The short name of the Telegraph account."""
+        return self._get_account_field("short_name")
+
+    @short_name.setter
+    def short_name(self, value: str) -> None:
+        self._cached_account_info()["short_name"] = value
+
+    @property
+    def author_name(self) -> str:
+        """str: The author name associated with the account."""
+        return self._get_account_field("author_name")
+
+    @author_name.setter
+    def author_name(self, value: str) -> None:
+        self._cached_account_info()["author_name"] = value
+
+    @property
+    def author_url(self) -> Optional[str]:
+        """str: The author URL associated with the account."""
+        return self._get_account_field("author_url")
+
+    @author_url.setter
+    def author_url(self, value: Optional[str]) -> None:
+        self._cached_account_info()["author_url"] = value
+
+    def _resolve_token_file_path(self) -> Path:
+        """Resolves the path to the access token file.
 
         The function checks for a custom token file path defined in the
         'PH_TOKEN_PATH' environment variable. If not found, it looks for the
@@ -87,65 +213,91 @@ class TelegraphAccount:
             return home / ".ph_token"
         return Path.cwd() / self.TOKEN_FILENAME
 
+    def _get_token_file_path(self) -> Path:
+        """Gets the path to the access token file.
+
+        The path is resolved once at initialization.
+
+        Returns:
+            Path: The path to the access token file.
+        """
+        return self._token_file_path
+
     def _get_token(self) -> Optional[str]:
         """Gets the access token from the token file.
 
         Returns:
             str: The access token if found in the token file, otherwise None.
+                An empty token file is treated as missing.
         """
-        token_file: Path = self._get_token_file_path()
-        if token_file.exists():
-            with open(token_file, "r") as f:
-                return f.read().strip()
-        return None
+        try:
+            with open(self._token_file_path, "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
 
     def _save_token(self, token: str) -> None:
         """Saves the access token to the token file.
 
+        The token is written to a temporary file that then replaces the
+        token file, so an interrupted write never leaves a truncated file.
+
         Args:
             token: The access token to save.
         """
-        token_file: Path = self._get_token_file_path()
-        token_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_file, "w") as f:
+        token_file: Path = self._token_file_path
+        if not self._token_dir_ready:
+            token_file.parent.mkdir(parents=True, exist_ok=True)
+            self._token_dir_ready = True
+        tmp_file: Path = token_file.with_suffix(token_file.suffix + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
             f.write(token)
+        os.replace(tmp_file, token_file)
 
     def _delete_token(self) -> None:
         """Deletes the access token file."""
-        token_file: Path = self._get_token_file_path()
-        if token_file.exists():
-            token_file.unlink()
+        try:
+            self._token_file_path.unlink()
+        except FileNotFoundError:
+            pass
 
     def _create_account(
         self, short_name: str, author_name: str, author_url: Optional[str]
-    ) -> Optional[str]:
+    ) -> Dict[str, Any]:
         """Creates a new Telegraph account.
 
+        The response is cached as the account information, so no separate
+        `getAccountInfo` request is needed afterwards.
+
         Args:
             short_name: The short name of the Telegraph account.
             author_name: The author name associated with the account.
             author_url: The author URL associated with the account.
 
         Returns:
-            str: The access token of the newly created account if successful,
-                otherwise None.
+            dict: The newly created account, including its access token, if
+                successful, otherwise an empty dictionary.
         """
-        url: str = f"{self.base_url}/createAccount"
+        url: str = _URL_CREATE_ACCOUNT
         data: Dict[str, Any] = {
             "short_name": short_name,
             "author_name": author_name,
             "author_url": author_url,
         }
         try:
-            response: requests.Response = requests.post(url, data=data)
+            response: requests.Response = self._session.post(
+                url, data=data, timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            access_token: str = response.json()["result"]["access_token"]
+            result: Dict[str, Any] = loads(response.content)["result"]
+            access_token: str = result["access_token"]
             self._save_token(access_token)
+            self._account_info_cache = result
             print(f"Account created with access token: {access_token}")
-            return access_token
-        except RequestException as e:
+            return result
+        except (RequestException, ValueError) as e:
             print(f"Error creating account: {e}")
-            return None
+            return {}
 
     def get_account_info(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Gets the account information for the current user.
@@ -158,15 +310,17 @@ class TelegraphAccount:
             dict: A dictionary containing the account information if
                 successful, otherwise an empty dictionary.
         """
-        url: str = f"{self.base_url}/getAccountInfo"
+        url: str = _URL_GET_ACCOUNT_INFO
         params: Dict[str, Any] = {"access_token": self.access_token}
         if fields:
-            params["fields"] = "[" + ",".join(f'"{field}"' for field in fields) + "]"
+            params["fields"] = dumps(fields)
         try:
-            response: requests.Response = requests.get(url, params=params)
+            response: requests.Response = self._session.get(
+                url, params=params, timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            return response.json()["result"]
-        except RequestException as e:
+            return loads(response.content)["result"]
+        except (RequestException, ValueError) as e:
             print(f"Error getting account info: {e}")
             return {}
 
@@ -188,17 +342,22 @@ class TelegraphAccount:
             bool: True if the token was successfully revoked and a new one
                 generated, otherwise False.
         """
-        url: str = f"{self.base_url}/revokeAccessToken"
+        url: str = _URL_REVOKE_ACCESS_TOKEN
         data: Dict[str, str] = {"access_token": self.access_token}
         try:
-            response: requests.Response = requests.post(url, data=data)
+            response: requests.Response = self._session.post(
+                url, data=data, timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             self._delete_token()
-            new_token: str = response.json()["result"]["access_token"]
+            result: Dict[str, Any] = loads(response.content)["result"]
+            new_token: str = result["access_token"]
             self._save_token(new_token)
             self.access_token = new_token
+            if self._account_info_cache is not None:
+                self._account_info_cache.update(result)
             return True
-        except RequestException as e:
+        except (RequestException, ValueError) as e:
             print(f"Error revoking access token: {e}")
             return False
 
@@ -210,6 +369,8 @@ class TelegraphAccount:
     ) -> bool:
         """Edits the account information for the current user.
 
+        Fields left as None are unchanged; an empty string clears the field.
+
         Args:
             short_name: The new short name for the account.
             author_name: The new author name for the account.
@@ -219,22 +380,27 @@ class TelegraphAccount:
             bool: True if the account information was successfully updated,
                 otherwise False.
         """
-        url: str = f"{self.base_url}/editAccountInfo"
+        url: str = _URL_EDIT_ACCOUNT_INFO
         data: Dict[str, Any] = {"access_token": self.access_token}
-        if short_name:
-            data["short_name"] = short_name
-        if author_name:
-            data["author_name"] = author_name
-        if author_url:
-            data["author_url"] = author_url
+        data.update(
+            {
+                key: value
+                for key, value in (
+                    ("short_name", short_name),
+                    ("author_name", author_name),
+                    ("author_url", author_url),
+                )
+                if value is not None
+            }
+        )
         try:
-            response: requests.Response = requests.post(url, data=data)
+            response: requests.Response = self._session.post(
+                url, data=data, timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            updated_info: Dict[str, Any] = response.json()["result"]
-            self.short_name = updated_info.get("short_name", self.short_name)
-            self.author_name = updated_info.get("author_name", self.author_name)
-            self.author_url = updated_info.get("author_url", self.author_url)
+            updated_info: Dict[str, Any] = loads(response.content)["result"]
+            self._account_info_cache = updated_info
             return True
-        except RequestException as e:
+        except (RequestException, ValueError) as e:
             print(f"Error editing account info: {e}")
             return False
@@ -1,16 +1,323 @@
-import json
 import re
-import time
-from typing import Optional, Dict, List, Any, Union
+import warnings
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple, Union
 
 import requests
 from requests.exceptions import RequestException
 
+from ._json import dumps, loads
 from .account import TelegraphAccount
-from .md_to_dom import md_to_dom
+from .md_to_dom import _copy_nodes, md_to_dom
 
+_PATH_RE = re.compile(r"(?:https?://(?:telegra\.ph/|telegraph\.com/))?([^/]+)/?$")
 
-class TelegraphAPI:
+
+def _serialize_content(content: Union[List[Dict[str, Any]], str, bytes]) -> str:
+    """Serializes page content for a request, unless it already is.
+
+    Args:
+        content: The content in Telegraph node format, or already serialized
+            as a JSON string or UTF-8 encoded bytes.
+
+    Returns:
+        str: The content as a JSON string.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, bytes):
+        return content.decode("utf-8")
+    return dumps(content)
+
+
+_DELETED_CONTENT: List[Dict[str, Any]] = [
+    {"tag": "p", "children": ["This page has been deleted."]}
+]
+
+
+class _BaseTelegraphAPI:
+    """State and request building shared by `TelegraphAPI` and its async twin.
+
+    Subclasses set `_account_class` and add the methods that send requests,
+    so that the two clients only differ in how requests are made.
+    """
+
+    PAGE_CACHE_SIZE: int = 128
+
+    _account_class: type = TelegraphAccount
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        short_name: str = "Your Name",
+        author_name: str = "Anonymous",
+        author_url: Optional[str] = None,
+    ) -> None:
+        self.account: TelegraphAccount = self._account_class(
+            access_token, short_name, author_name, author_url
+        )
+        self.base_url: str = "https://api.telegra.ph"
+        self._page_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._title_cache: Dict[str, str] = {}
+
+    def _extract_path(self, path_or_url: str) -> str:
+        """Extracts the path from a Telegraph URL or path string.
+
+        Args:
+            path_or_url: The Telegraph URL or path.
+
+        Returns:
+            str: The extracted path.
+
+        Raises:
+            ValueError: If the input is not a valid Telegraph path or URL.
+        """
+        if path_or_url and "/" not in path_or_url:
+            # Already a bare path, e.g. from `get_page_list`.
+            return path_or_url
+        match = _PATH_RE.search(path_or_url)
+        if match:
+            return match.group(1)
+        raise ValueError("Invalid path or URL format")
+
+    def _get_cached_page(self, path: str) -> Optional[Dict[str, Any]]:
+        """Gets a page from the page cache.
+
+        Args:
+            path: The path of the page.
+
+        Returns:
+            dict: The cached page with 'title' and 'content', or None if the
+                page is not cached.
+        """
+        page = self._page_cache.get(path)
+        if page is not None:
+            self._page_cache.move_to_end(path)
+        return page
+
+    def _cache_page(self, path: str, title: str, content: List[Any]) -> None:
+        """Stores a page in the page cache, evicting the least recently used.
+
+        The title is also remembered in the title cache, which is not bounded.
+        The content is stored as is, so callers pass a copy if they hand the
+        same content to the user.
+
+        Args:
+            path: The path of the page.
+            title: The title of the page.
+            content: The content of the page in Telegraph node format.
+        """
+        self._title_cache[path] = title
+        self._page_cache[path] = {"title": title, "content": content}
+        self._page_cache.move_to_end(path)
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drops a page, or all pages, from the page cache.
+
+        Use this when a page may have been edited by another client, so the
+        next `get_page` call fetches it again.
+
+        Args:
+            path: The path or URL of the page. If None, the whole cache is
+                cleared.
+        """
+        if path is None:
+            self._page_cache.clear()
+            self._title_cache.clear()
+        else:
+            path = self._extract_path(path)
+            self._page_cache.pop(path, None)
+            self._title_cache.pop(path, None)
+
+    def _page_data(
+        self,
+        title: str,
+        content: Union[List[Dict[str, Any]], str, bytes],
+        author_name: Optional[str],
+        author_url: Optional[str],
+        path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Builds the data of a `createPage` or, given a path, `editPage` request.
+
+        Editing drops the page from the page cache.
+
+        Args:
+            title: The title of the page.
+            content: The content of the page in Telegraph node format, or
+                already serialized as a JSON string or bytes.
+            author_name: The author name, or None for the account's.
+            author_url: The author URL, or None for the account's.
+            path: The path of the page to edit, or None to create one.
+
+        Returns:
+            dict: The request data.
+        """
+        data: Dict[str, Any] = {
+            "access_token": self.account.access_token,
+            "title": title,
+            "content": _serialize_content(content),
+            # Always requested, so that the page can be cached.
+            "return_content": True,
+            "author_name": author_name or self.account.author_name,
+            "author_url": author_url or self.account.author_url,
+        }
+        if path is not None:
+            data["path"] = path
+            self._page_cache.pop(path, None)
+        return data
+
+    def _delete_page_data(self, path: str) -> Dict[str, Any]:
+        """Builds the data of the `editPage` request that deletes a page.
+
+        The page is dropped from the page and title caches.
+
+        Args:
+            path: The path of the page.
+
+        Returns:
+            dict: The request data.
+        """
+        self._page_cache.pop(path, None)
+        self._title_cache.pop(path, None)
+        return {
+            "access_token": self.account.access_token,
+            "path": path,
+            "title": "404",
+            "content": dumps(_DELETED_CONTENT),
+            "author_name": "Deleted",
+            "author_url": None,
+        }
+
+    def _cached_page_result(self, path: str) -> Optional[Dict[str, Any]]:
+        """Builds a `get_page` result from the page cache.
+
+        Args:
+            path: The path of the page.
+
+        Returns:
+            dict: The result with a copy of the cached content, or None if
+                the page is not cached.
+        """
+        cached_page = self._get_cached_page(path)
+        if cached_page is None:
+            return None
+        return {
+            "success": True,
+            "title": cached_page["title"],
+            "content": _copy_nodes(cached_page["content"]),
+            "error": None,
+            "attempts": 0,
+        }
+
+    def _page_result(
+        self,
+        path: str,
+        return_content: bool,
+        api_result: Optional[Dict[str, Any]],
+        error: Optional[Exception] = None,
+        attempts: int = 1,
+    ) -> Dict[str, Any]:
+        """Builds a `get_page` result from a `getPage` response or error.
+
+        A page retrieved with its content is cached.
+
+        Args:
+            path: The path of the page.
+            return_content: Whether the content was requested.
+            api_result: The `getPage` result, or None if the request failed.
+            error: The error the request failed with.
+            attempts: The number of requests made.
+
+        Returns:
+            dict: The result, with custom error content if the request failed.
+        """
+        if api_result is None:
+            # Create custom error content
+            error_md = f"# Error\n\nFailed to retrieve page after {attempts} attempts.\n\nError: {error}"
+            return {
+                "success": False,
+                "title": None,
+                "content": md_to_dom(error_md),
+                "error": str(error),
+                "attempts": attempts,
+            }
+        result = {
+            "success": True,
+            "title": api_result.get("title"),
+            "content": api_result.get("content", []),
+            "error": None,
+            "attempts": attempts,
+        }
+        if return_content:
+            self._cache_page(path, result["title"], _copy_nodes(result["content"]))
+        return result
+
+    def _page_list_data(self, offset: int, limit: int) -> Dict[str, Any]:
+        """Builds the data of a `getPageList` request.
+
+        Args:
+            offset: The sequential number of the first page to be returned.
+            limit: The number of pages to be returned.
+
+        Returns:
+            dict: The request data.
+        """
+        return {
+            "access_token": self.account.access_token,
+            "offset": offset,
+            "limit": max(1, min(200, limit)),  # Ensure limit is between 1 and 200
+        }
+
+    def _cache_page_list(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Remembers the titles of a `getPageList` result.
+
+        Args:
+            result: The `getPageList` result.
+
+        Returns:
+            dict: The result itself.
+        """
+        for page in result.get("pages", []):
+            self._title_cache[page["path"]] = page["title"]
+        return result
+
+    def _views_data(
+        self,
+        path: str,
+        year: Optional[int],
+        month: Optional[int],
+        day: Optional[int],
+        hour: Optional[int],
+    ) -> Dict[str, Any]:
+        """Builds the data of a `getViews` request.
+
+        Each date argument is only sent if all less precise ones are given.
+
+        Args:
+            path: The path or URL of the article.
+            year: The year to get views for.
+            month: The month to get views for.
+            day: The day to get views for.
+            hour: The hour to get views for.
+
+        Returns:
+            dict: The request data.
+        """
+        data: Dict[str, Any] = {"path": self._extract_path(path)}
+        if year:
+            data["year"] = year
+        if month and year:
+            data["month"] = month
+        if day and month and year:
+            data["day"] = day
+        if hour and day and month and year:
+            data["hour"] = hour
+        return data
+
+
+class TelegraphAPI(_BaseTelegraphAPI):
     """Interacts with the Telegraph API to manage pages and accounts.
 
     This class provides methods for:
@@ -28,8 +335,18 @@ class TelegraphAPI:
         2. Regular methods for Telegraph DOM input.
 
         Choose the method that best fits your use case.
+
+        Pages retrieved with `get_page`, created or edited are cached (up to
+        `PAGE_CACHE_SIZE` pages), so reading them back needs no request.
+        Call `invalidate` if a page may have been changed by another client.
+
+        All requests, including those of `account`, share one keep-alive
+        `requests.Session`. Use the instance as a context manager, or call
+        `close`, to release it.
     """
 
+    _account_class = TelegraphAccount
+
     def __init__(
         self,
         access_token: Optional[str] = None,
@@ -45,10 +362,19 @@ class TelegraphAPI:
             author_name: The author name associated with the account.
             author_url: The author URL associated with the account.
         """
-        self.account: TelegraphAccount = TelegraphAccount(
-            access_token, short_name, author_name, author_url
-        )
-        self.base_url: str = "https://api.telegra.ph"
+        super().__init__(access_token, short_name, author_name, author_url)
+        # Both talk to the same host, so share the account's connection pool.
+        self._session: requests.Session = self.account._session
+
+    def __enter__(self) -> "TelegraphAPI":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        self.account.close()
 
     def _make_request(
         self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
@@ -65,46 +391,32 @@ class TelegraphAPI:
 
         Raises:
             RequestException: If there's an error with the request.
+            ValueError: If the response is not valid JSON.
             Exception: If the API returns an error response.
         """
         url: str = f"{self.base_url}/{endpoint}"
         try:
             if method.upper() == "GET":
-                response: requests.Response = requests.get(url, params=data)
+                response: requests.Response = self._session.get(
+                    url, params=data, timeout=self.account.REQUEST_TIMEOUT
+                )
             else:
-                response: requests.Response = requests.post(url, data=data)
+                response: requests.Response = self._session.post(
+                    url, data=data, timeout=self.account.REQUEST_TIMEOUT
+                )
             response.raise_for_status()
-            result = response.json()
+            result = loads(response.content)
             if not result.get("ok"):
                 raise Exception(f"API error: {result.get('error', 'Unknown error')}")
             return result["result"]
-        except RequestException as e:
+        except (RequestException, ValueError) as e:
             print(f"Error making request to {endpoint}: {e}")
             raise
 
-    def _extract_path(self, path_or_url: str) -> str:
-        """Extracts the path from a Telegraph URL or path string.
-
-        Args:
-            path_or_url: The Telegraph URL or path.
-
-        Returns:
-            str: The extracted path.
-
-        Raises:
-            ValueError: If the input is not a valid Telegraph path or URL.
-        """
-        match = re.search(
-            r"(?:https?://(?:telegra\.ph/|telegraph\.com/))?([^/]+)/?$", path_or_url
-        )
-        if match:
-            return match.group(1)
-        raise ValueError("Invalid path or URL format")
-
     def create_page(
         self,
         title: str,
-        content: List[Dict[str, Any]],
+        content: Union[List[Dict[str, Any]], str, bytes],
         author_name: Optional[str] = None,
         author_url: Optional[str] = None,
         return_content: bool = False,
@@ -113,7 +425,8 @@ class TelegraphAPI:
 
         Args:
             title: The title of the page.
-            content: The content of the page in Telegraph node format.
+            content: The content of the page in Telegraph node format, or
+                already serialized as a JSON string or bytes.
             author_name: The author name for this specific page.
             author_url: The author URL for this specific page.
             return_content: Whether to return the content in the response.
@@ -123,16 +436,14 @@ class TelegraphAPI:
 
         Note:
             Use the `create_page_md` method for Markdown content.
+
+            When the same content is sent many times, serialize it once
+            (e.g. with `json.dumps`) and pass the string to skip encoding it
+            again on every call.
         """
-        data: Dict[str, Any] = {
-            "access_token": self.account.access_token,
-            "title": title,
-            "content": json.dumps(content),
-            "return_content": return_content,
-            "author_name": author_name or self.account.author_name,
-            "author_url": author_url or self.account.author_url,
-        }
+        data: Dict[str, Any] = self._page_data(title, content, author_name, author_url)
         result: Dict[str, Any] = self._make_request("POST", "createPage", data)
+        self._cache_page(result["path"], result["title"], result["content"])
         if return_content:
             print("Returned content:", result.get("content"))
         return result["url"]
@@ -165,7 +476,7 @@ class TelegraphAPI:
     def edit_page(
         self,
         path: str,
-        content: List[Dict[str, Any]],
+        content: Union[List[Dict[str, Any]], str, bytes],
         title: Optional[str] = None,
         author_name: Optional[str] = None,
         author_url: Optional[str] = None,
@@ -177,7 +488,8 @@ class TelegraphAPI:
 
         Args:
             path: The path or URL of the page to edit.
-            content: The new content of the page in Telegraph node format.
+            content: The new content of the page in Telegraph node format,
+                or already serialized as a JSON string or bytes.
             title: The new title of the page. If None, the original title is kept.
             author_name: The new author name for this specific page.
             author_url: The new author URL for this specific page.
@@ -191,17 +503,12 @@ class TelegraphAPI:
         """
         path = self._extract_path(path)
         if not title:
-            title = self.get_page(path)["title"]
-        data: Dict[str, Any] = {
-            "access_token": self.account.access_token,
-            "path": path,
-            "title": title,
-            "content": json.dumps(content),
-            "return_content": return_content,
-            "author_name": author_name or self.account.author_name,
-            "author_url": author_url or self.account.author_url,
-        }
+            title = self._title_cache.get(path) or self.get_page(path)["title"]
+        data: Dict[str, Any] = self._page_data(
+            title, content, author_name, author_url, path
+        )
         result: Dict[str, Any] = self._make_request("POST", "editPage", data)
+        self._cache_page(path, result["title"], result["content"])
         return result["url"]
 
     def edit_page_md(
@@ -234,6 +541,24 @@ class TelegraphAPI:
         )
         return result
 
+    def _get_title_and_content(self, path: str) -> Tuple[Optional[str], List[Any]]:
+        """Gets the title and content of a page with a single `get_page` call.
+
+        The page cache is bypassed, so that content edited elsewhere is not
+        overwritten with a stale copy.
+
+        Args:
+            path: The path or URL of the page.
+
+        Returns:
+            tuple: The title and the content of the page. The title is None
+                if the page could not be retrieved.
+        """
+        path = self._extract_path(path)
+        self._page_cache.pop(path, None)
+        page: Dict[str, Any] = self.get_page(path)
+        return page["title"], page["content"]
+
     def edit_page_md_append_to_front(
         self,
         path: str,
@@ -255,10 +580,22 @@ class TelegraphAPI:
 
         Returns:
             str: The URL of the edited page.
+
+        Raises:
+            Exception: If the page could not be retrieved. It is left
+                unchanged, so that its content is not overwritten.
         """
-        telegraph_content = md_to_dom(content) + self.get_page(path)["content"]
+        original_title, original_content = self._get_title_and_content(path)
+        if original_title is None:
+            raise Exception(f"Failed to retrieve page {path}, not editing it")
+        telegraph_content = md_to_dom(content) + original_content
         result = self.edit_page(
-            path, telegraph_content, title, author_name, author_url, return_content
+            path,
+            telegraph_content,
+            title or original_title,
+            author_name,
+            author_url,
+            return_content,
         )
         return result
 
@@ -283,11 +620,22 @@ class TelegraphAPI:
 
         Returns:
             str: The URL of the edited page.
+
+        Raises:
+            Exception: If the page could not be retrieved. It is left
+                unchanged, so that its content is not overwritten.
         """
-        original_content = self.get_page(path)["content"]
+        original_title, original_content = self._get_title_and_content(path)
+        if original_title is None:
+            raise Exception(f"Failed to retrieve page {path}, not editing it")
         telegraph_content: List[Dict[str, Any]] = original_content + md_to_dom(content)
         result = self.edit_page(
-            path, telegraph_content, title, author_name, author_url, return_content
+            path,
+            telegraph_content,
+            title or original_title,
+            author_name,
+            author_url,
+            return_content,
         )
         return result
 
@@ -303,20 +651,9 @@ class TelegraphAPI:
             bool: True if the page was successfully deleted, False otherwise.
         """
         path = self._extract_path(path)
-        expected_content = [{"tag": "p", "children": ["This page has been deleted."]}]
-        data: Dict[str, Any] = {
-            "access_token": self.account.access_token,
-            "path": path,
-            "title": "404",
-            "content": json.dumps(expected_content),
-            "author_name": "Deleted",
-            "author_url": None,
-        }
-        result: Dict[str, Any] = self._make_request("POST", "editPage", data)
+        self._make_request("POST", "editPage", self._delete_page_data(path))
         # Verify deletion by checking the latest content.
-        latest_content = self.get_page(path)
-        # Compare the content as lists of dictionaries
-        return latest_content == expected_content
+        return self.get_page(path)["content"] == _DELETED_CONTENT
 
     def get_page(
         self,
@@ -326,14 +663,19 @@ class TelegraphAPI:
         max_retries: int = 3,
         retry_delay: float = 1.0,
     ) -> Dict[str, Any]:
-        """Retrieves a Telegraph page with retry mechanism and custom error content.
+        """Retrieves a Telegraph page with custom error content on failure.
 
         Args:
             path: The path or URL of the page to retrieve.
             return_content: Whether to return the content in the response.
-            retry: Whether to use the retry mechanism.
-            max_retries: Maximum number of retry attempts if retry is True.
-            retry_delay: Delay between retry attempts in seconds if retry is True.
+            retry: Deprecated and ignored, as the session retries failed
+                requests itself; a `DeprecationWarning` is emitted if any
+                retry argument is not left at its default.
+                `AsyncTelegraphAPI.aget_page` still honours it.
+            max_retries: Deprecated and ignored. `AsyncTelegraphAPI.aget_page`
+                still honours it.
+            retry_delay: Deprecated and ignored. `AsyncTelegraphAPI.aget_page`
+                still honours it.
 
         Returns:
             dict: A dictionary containing:
@@ -344,42 +686,39 @@ class TelegraphAPI:
                 - 'attempts': Number of attempts made to retrieve the page.
 
         Note:
-            If all retry attempts fail, a custom error content in Markdown format
+            If the request fails, a custom error content in Markdown format
             will be returned instead of the actual page content.
+
+            A single request is made. Connection errors, read errors and
+            gateway errors (502, 503, 504) are retried with backoff by the
+            session itself; errors returned by the API, such as a missing
+            page, are not retried.
+
+            When `return_content` is True, a cached copy of the page is
+            returned if available, with 'attempts' set to 0.
         """
+        if (retry, max_retries, retry_delay) != (True, 3, 1.0):
+            warnings.warn(
+                "The retry, max_retries and retry_delay arguments of get_page "
+                "are deprecated and ignored; the session retries failed "
+                "requests itself.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         path = self._extract_path(path)
+        if return_content:
+            cached_result = self._cached_page_result(path)
+            if cached_result is not None:
+                return cached_result
         data: Dict[str, Any] = {
             "path": path,
             "return_content": return_content,
         }
-
-        result = {
-            "success": False,
-            "title": None,
-            "content": [],
-            "error": None,
-            "attempts": 0,
-        }
-
-        for attempt in range(max_retries if retry else 1):
-            result["attempts"] += 1
-            try:
-                api_result: Dict[str, Any] = self._make_request("GET", "getPage", data)
-                result["success"] = True
-                result["content"] = api_result.get("content", [])
-                result["title"] = api_result.get("title")
-                return result
-            except Exception as e:
-                result["error"] = str(e)
-                if attempt < max_retries - 1 and retry:
-                    time.sleep(retry_delay)
-                else:
-                    # Create custom error content
-                    error_md = f"# Error\n\nFailed to retrieve page after {result['attempts']} attempts.\n\nError: {result['error']}"
-                    result["content"] = md_to_dom(error_md)
-                    return result
-
-        return result
+        try:
+            api_result: Dict[str, Any] = self._make_request("GET", "getPage", data)
+        except Exception as e:
+            return self._page_result(path, return_content, None, e)
+        return self._page_result(path, return_content, api_result)
 
     def get_page_list(self, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
         """Retrieves a list of pages belonging to the Telegraph account.
@@ -409,12 +748,8 @@ class TelegraphAPI:
             }
             ```
         """
-        data: Dict[str, Any] = {
-            "access_token": self.account.access_token,
-            "offset": offset,
-            "limit": max(1, min(200, limit)),  # Ensure limit is between 1 and 200
-        }
-        return self._make_request("GET", "getPageList", data)
+        data: Dict[str, Any] = self._page_list_data(offset, limit)
+        return self._cache_page_list(self._make_request("GET", "getPageList", data))
 
     def get_views(
         self,
@@ -442,16 +777,7 @@ class TelegraphAPI:
             arguments must also be provided. For example, if `day` is
             provided, both `year` and `month` must also be provided.
         """
-        path = self._extract_path(path)
-        data: Dict[str, Any] = {"path": path}
-        if year:
-            data["year"] = year
-        if month and year:
-            data["month"] = month
-        if day and month and year:
-            data["day"] = day
-        if hour and day and month and year:
-            data["hour"] = hour
+        data: Dict[str, Any] = self._views_data(path, year, month, day, hour)
         result: Dict[str, Any] = self._make_request("GET", "getViews", data)
         return {"views": result["views"]}
 
@@ -0,0 +1,263 @@
+from typing import Optional, Dict, List, Any
+
+import aiohttp
+
+from ._json import dumps, loads
+from .account import (
+    TelegraphAccount,
+    _URL_CREATE_ACCOUNT,
+    _URL_EDIT_ACCOUNT_INFO,
+    _URL_GET_ACCOUNT_INFO,
+    _URL_REVOKE_ACCESS_TOKEN,
+)
+
+
+def _form(data: Dict[str, Any]) -> Dict[str, str]:
+    """Prepares request data for aiohttp, which only accepts strings.
+
+    Args:
+        data: The data to send with the request.
+
+    Returns:
+        dict: The data without None values, with booleans as 'true' or
+            'false' and other values as strings.
+    """
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+        for key, value in data.items()
+        if value is not None
+    }
+
+
+class AsyncTelegraphAccount(TelegraphAccount):
+    """Interacts with the Telegraph API to manage accounts asynchronously.
+
+    This class mirrors `TelegraphAccount` with coroutine methods prefixed
+    with 'a' (e.g. `aget_account_info`), backed by a pooled
+    `aiohttp.ClientSession`. Independent calls can then be run
+    concurrently with `asyncio.gather`.
+
+    Note:
+        The account must be entered with `async with` (or `await ainit()`
+        and later `await aclose()`) before use. If no token is given or
+        found in the token file, the account is created on entering.
+
+    Example:
+        >>> async with AsyncTelegraphAccount() as account:
+        ...     print(account.short_name)
+        ...     await account.aedit_account_info(author_name="New Author Name")
+    """
+
+    __slots__ = ("_asession",)
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        short_name: str = "Your Name",
+        author_name: str = "Anonymous",
+        author_url: Optional[str] = None,
+    ) -> None:
+        """Initializes an AsyncTelegraphAccount object.
+
+        No request is made here; see `ainit`.
+
+        Args:
+            access_token: The access token for the Telegraph account.
+                If not provided, it will be loaded from the token file or a
+                new account will be created by `ainit`.
+            short_name: The short name of the Telegraph account.
+                Only used when creating a new account. Defaults to "Your Name".
+            author_name: The author name associated with the account.
+                Only used when creating a new account. Defaults to "Anonymous".
+            author_url: The author URL associated with the account.
+                Only used when creating a new account. Defaults to None.
+        """
+        self._asession: Optional[aiohttp.ClientSession] = None
+        super().__init__(access_token, short_name, author_name, author_url)
+
+    async def __aenter__(self) -> "AsyncTelegraphAccount":
+        return await self.ainit()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def ainit(self) -> "AsyncTelegraphAccount":
+        """Opens the HTTP session and resolves the account.
+
+        Creates a new account if no access token is available, and fetches
+        the account information so that the account properties do not block.
+        The information is not fetched if the account could not be created.
+        If this raises, the HTTP session is closed again.
+
+        Returns:
+            AsyncTelegraphAccount: The account itself.
+        """
+        if self._asession is None:
+            self._asession = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+        try:
+            if not self.access_token:
+                self.access_token = (
+                    await self._acreate_account(**self._default_account_info)
+                ).get("access_token")
+            if self.access_token and self._account_info_cache is None:
+                account_info: Dict[str, Any] = await self.aget_account_info(
+                    fields=self.ACCOUNT_INFO_FIELDS
+                )
+                if account_info:
+                    self._account_info_cache = account_info
+        except BaseException:
+            await self.aclose()
+            raise
+        return self
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP sessions and their pooled connections."""
+        if self._asession is not None:
+            await self._asession.close()
+            self._asession = None
+        self.close()
+
+    def _create_account(
+        self, short_name: str, author_name: str, author_url: Optional[str]
+    ) -> Dict[str, Any]:
+        """Defers account creation to `ainit`.
+
+        Returns:
+            dict: Always an empty dictionary.
+        """
+        return {}
+
+    async def _acreate_account(
+        self, short_name: str, author_name: str, author_url: Optional[str]
+    ) -> Dict[str, Any]:
+        """Creates a new Telegraph account.
+
+        Args:
+            short_name: The short name of the Telegraph account.
+            author_name: The author name associated with the account.
+            author_url: The author URL associated with the account.
+
+        Returns:
+            dict: The newly created account, including its access token, if
+                successful, otherwise an empty dictionary.
+        """
+        url: str = _URL_CREATE_ACCOUNT
+        data: Dict[str, Any] = {
+            "short_name": short_name,
+            "author_name": author_name,
+            "author_url": author_url,
+        }
+        try:
+            async with self._asession.post(url, data=_form(data)) as response:
+                response.raise_for_status()
+                result: Dict[str, Any] = loads(await response.read())["result"]
+            access_token: str = result["access_token"]
+            self._save_token(access_token)
+            self._account_info_cache = result
+            print(f"Account created with access token: {access_token}")
+            return result
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"Error creating account: {e}")
+            return {}
+
+    async def aget_account_info(
+        self, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Gets the account information for the current user.
+
+        Args:
+            fields: A list of fields to retrieve.
+                If None, all fields are retrieved.
+
+        Returns:
+            dict: A dictionary containing the account information if
+                successful, otherwise an empty dictionary.
+        """
+        url: str = _URL_GET_ACCOUNT_INFO
+        params: Dict[str, Any] = {"access_token": self.access_token}
+        if fields:
+            params["fields"] = dumps(fields)
+        try:
+            async with self._asession.get(url, params=_form(params)) as response:
+                response.raise_for_status()
+                return loads(await response.read())["result"]
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"Error getting account info: {e}")
+            return {}
+
+    async def aget_authorization_url(self) -> str:
+        """Gets the authorization URL for the current user.
+
+        Returns:
+            str: The authorization URL.
+        """
+        return (await self.aget_account_info(fields=["auth_url"])).get("auth_url", "")
+
+    async def arevoke_access_token(self) -> bool:
+        """Revokes the current access token and generates a new one.
+
+        Returns:
+            bool: True if the token was successfully revoked and a new one
+                generated, otherwise False.
+        """
+        url: str = _URL_REVOKE_ACCESS_TOKEN
+        data: Dict[str, str] = {"access_token": self.access_token}
+        try:
+            async with self._asession.post(url, data=_form(data)) as response:
+                response.raise_for_status()
+                result: Dict[str, Any] = loads(await response.read())["result"]
+            self._delete_token()
+            new_token: str = result["access_token"]
+            self._save_token(new_token)
+            self.access_token = new_token
+            if self._account_info_cache is not None:
+                self._account_info_cache.update(result)
+            return True
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"Error revoking access token: {e}")
+            return False
+
+    async def aedit_account_info(
+        self,
+        short_name: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+    ) -> bool:
+        """Edits the account information for the current user.
+
+        Fields left as None are unchanged; an empty string clears the field.
+
+        Args:
+            short_name: The new short name for the account.
+            author_name: The new author name for the account.
+            author_url: The new author URL for the account.
+
+        Returns:
+            bool: True if the account information was successfully updated,
+                otherwise False.
+        """
+        url: str = _URL_EDIT_ACCOUNT_INFO
+        data: Dict[str, Any] = {"access_token": self.access_token}
+        data.update(
+            {
+                key: value
+                for key, value in (
+                    ("short_name", short_name),
+                    ("author_name", author_name),
+                    ("author_url", author_url),
+                )
+                if value is not None
+            }
+        )
+        try:
+            async with self._asession.post(url, data=_form(data)) as response:
+                response.raise_for_status()
+                updated_info: Dict[str, Any] = loads(await response.read())["result"]
+            self._account_info_cache = updated_info
+            return True
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"Error editing account info: {e}")
+            return False
@@ -0,0 +1,318 @@
+import asyncio
+from typing import Optional, Dict, List, Any, Tuple, Union
+
+import aiohttp
+
+from ._json import loads
+from .api import _BaseTelegraphAPI, _DELETED_CONTENT
+from .async_account import AsyncTelegraphAccount, _form
+from .md_to_dom import md_to_dom
+
+
+class AsyncTelegraphAPI(_BaseTelegraphAPI):
+    """Interacts with the Telegraph API to manage pages asynchronously.
+
+    This class mirrors `TelegraphAPI` with coroutine methods prefixed with
+    'a' (e.g. `acreate_page_md`); see `TelegraphAPI` for their full
+    documentation. All requests share the pooled `aiohttp.ClientSession` of
+    an `AsyncTelegraphAccount`, so independent page operations can be run
+    concurrently with `asyncio.gather`. The page cache and `invalidate` work
+    as in `TelegraphAPI`.
+
+    Note:
+        The instance must be entered with `async with` (or `await ainit()`
+        and later `await aclose()`) before use.
+
+    Example:
+        >>> async with AsyncTelegraphAPI() as ph:
+        ...     urls = await asyncio.gather(
+        ...         ph.acreate_page_md("First", "# One"),
+        ...         ph.acreate_page_md("Second", "# Two"),
+        ...     )
+    """
+
+    _account_class = AsyncTelegraphAccount
+
+    async def __aenter__(self) -> "AsyncTelegraphAPI":
+        return await self.ainit()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def ainit(self) -> "AsyncTelegraphAPI":
+        """Opens the HTTP session and resolves the account.
+
+        Returns:
+            AsyncTelegraphAPI: The instance itself.
+        """
+        await self.account.ainit()
+        return self
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP sessions and their pooled connections."""
+        await self.account.aclose()
+
+    async def _amake_request(
+        self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Makes a request to the Telegraph API.
+
+        Args:
+            method: The HTTP method to use (GET or POST).
+            endpoint: The API endpoint to call.
+            data: The data to send with the request.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            aiohttp.ClientError: If there's an error with the request.
+            ValueError: If the response is not valid JSON.
+            Exception: If the API returns an error response.
+        """
+        url: str = f"{self.base_url}/{endpoint}"
+        form: Dict[str, str] = _form(data or {})
+        session: aiohttp.ClientSession = self.account._asession
+        try:
+            if method.upper() == "GET":
+                request = session.get(url, params=form)
+            else:
+                request = session.post(url, data=form)
+            async with request as response:
+                response.raise_for_status()
+                result = loads(await response.read())
+            if not result.get("ok"):
+                raise Exception(f"API error: {result.get('error', 'Unknown error')}")
+            return result["result"]
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"Error making request to {endpoint}: {e}")
+            raise
+
+    async def acreate_page(
+        self,
+        title: str,
+        content: Union[List[Dict[str, Any]], str, bytes],
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Creates a new Telegraph page; see `TelegraphAPI.create_page`."""
+        data: Dict[str, Any] = self._page_data(title, content, author_name, author_url)
+        result: Dict[str, Any] = await self._amake_request("POST", "createPage", data)
+        self._cache_page(result["path"], result["title"], result["content"])
+        if return_content:
+            print("Returned content:", result.get("content"))
+        return result["url"]
+
+    async def acreate_page_md(
+        self,
+        title: str,
+        content: str,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Creates a page from Markdown; see `TelegraphAPI.create_page_md`."""
+        return await self.acreate_page(
+            title, md_to_dom(content), author_name, author_url, return_content
+        )
+
+    async def aedit_page(
+        self,
+        path: str,
+        content: Union[List[Dict[str, Any]], str, bytes],
+        title: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Edits an existing Telegraph page; see `TelegraphAPI.edit_page`."""
+        path = self._extract_path(path)
+        if not title:
+            title = self._title_cache.get(path) or (await self.aget_page(path))["title"]
+        data: Dict[str, Any] = self._page_data(
+            title, content, author_name, author_url, path
+        )
+        result: Dict[str, Any] = await self._amake_request("POST", "editPage", data)
+        self._cache_page(path, result["title"], result["content"])
+        return result["url"]
+
+    async def aedit_page_md(
+        self,
+        path: str,
+        content: str,
+        title: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Edits a page with Markdown; see `TelegraphAPI.edit_page_md`."""
+        return await self.aedit_page(
+            path, md_to_dom(content), title, author_name, author_url, return_content
+        )
+
+    async def _aget_title_and_content(
+        self, path: str
+    ) -> Tuple[Optional[str], List[Any]]:
+        """Gets the title and content of a page with a single `aget_page` call.
+
+        The page cache is bypassed, so that content edited elsewhere is not
+        overwritten with a stale copy.
+
+        Args:
+            path: The path or URL of the page.
+
+        Returns:
+            tuple: The title and the content of the page. The title is None
+                if the page could not be retrieved.
+        """
+        path = self._extract_path(path)
+        self._page_cache.pop(path, None)
+        page: Dict[str, Any] = await self.aget_page(path)
+        return page["title"], page["content"]
+
+    async def aedit_page_md_append_to_front(
+        self,
+        path: str,
+        content: str,
+        title: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Prepends Markdown; see `TelegraphAPI.edit_page_md_append_to_front`."""
+        original_title, original_content = await self._aget_title_and_content(path)
+        if original_title is None:
+            raise Exception(f"Failed to retrieve page {path}, not editing it")
+        telegraph_content: List[Dict[str, Any]] = md_to_dom(content) + original_content
+        return await self.aedit_page(
+            path,
+            telegraph_content,
+            title or original_title,
+            author_name,
+            author_url,
+            return_content,
+        )
+
+    async def aedit_page_md_append_to_back(
+        self,
+        path: str,
+        content: str,
+        title: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+        return_content: bool = False,
+    ) -> str:
+        """Appends Markdown; see `TelegraphAPI.edit_page_md_append_to_back`."""
+        original_title, original_content = await self._aget_title_and_content(path)
+        if original_title is None:
+            raise Exception(f"Failed to retrieve page {path}, not editing it")
+        telegraph_content: List[Dict[str, Any]] = original_content + md_to_dom(content)
+        return await self.aedit_page(
+            path,
+            telegraph_content,
+            title or original_title,
+            author_name,
+            author_url,
+            return_content,
+        )
+
+    async def adelete_page(self, path: str) -> bool:
+        """Deletes a Telegraph page; see `TelegraphAPI.delete_page`."""
+        path = self._extract_path(path)
+        await self._amake_request("POST", "editPage", self._delete_page_data(path))
+        # Verify deletion by checking the latest content.
+        return (await self.aget_page(path))["content"] == _DELETED_CONTENT
+
+    async def aget_page(
+        self,
+        path: str,
+        return_content: bool = True,
+        retry: bool = True,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> Dict[str, Any]:
+        """Retrieves a Telegraph page; see `TelegraphAPI.get_page`.
+
+        aiohttp does not retry failed requests itself, so connection errors
+        are retried here. Errors returned by the API are not retried.
+
+        Args:
+            path: The path or URL of the page to retrieve.
+            return_content: Whether to return the content in the response.
+            retry: Whether to retry on connection errors. Unlike in
+                `TelegraphAPI.get_page`, where it is ignored, it is honoured.
+            max_retries: The maximum number of attempts, at least 1. Unlike
+                in `TelegraphAPI.get_page`, where it is ignored, it is honoured.
+            retry_delay: The delay in seconds between attempts. Unlike in
+                `TelegraphAPI.get_page`, where it is ignored, it is honoured.
+
+        Returns:
+            dict: The page, as returned by `TelegraphAPI.get_page`.
+        """
+        path = self._extract_path(path)
+        if return_content:
+            cached_result = self._cached_page_result(path)
+            if cached_result is not None:
+                return cached_result
+        data: Dict[str, Any] = {
+            "path": path,
+            "return_content": return_content,
+        }
+        attempts: int = max(1, max_retries) if retry else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                api_result: Dict[str, Any] = await self._amake_request(
+                    "GET", "getPage", data
+                )
+            except aiohttp.ClientError as e:
+                if attempt == attempts:
+                    return self._page_result(path, return_content, None, e, attempt)
+                await asyncio.sleep(retry_delay)
+            except Exception as e:
+                return self._page_result(path, return_content, None, e, attempt)
+            else:
+                return self._page_result(
+                    path, return_content, api_result, None, attempt
+                )
+
+    async def aget_page_list(self, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """Retrieves the account's pages; see `TelegraphAPI.get_page_list`."""
+        data: Dict[str, Any] = self._page_list_data(offset, limit)
+        return self._cache_page_list(
+            await self._amake_request("GET", "getPageList", data)
+        )
+
+    async def aget_views(
+        self,
+        path: str,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        day: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Retrieves the views of a page; see `TelegraphAPI.get_views`."""
+        data: Dict[str, Any] = self._views_data(path, year, month, day, hour)
+        result: Dict[str, Any] = await self._amake_request("GET", "getViews", data)
+        return {"views": result["views"]}
+
+    async def aget_account_info(
+        self, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Retrieves account information; see `TelegraphAPI.get_account_info`."""
+        return await self.account.aget_account_info(fields)
+
+    async def arevoke_access_token(self) -> bool:
+        """Revokes the access token; see `TelegraphAPI.revoke_access_token`."""
+        return await self.account.arevoke_access_token()
+
+    async def aedit_account_info(
+        self,
+        short_name: Optional[str] = None,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+    ) -> bool:
+        """Edits the account information; see `TelegraphAPI.edit_account_info`."""
+        return await self.account.aedit_account_info(
+            short_name, author_name, author_url
+        )
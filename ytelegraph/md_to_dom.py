@@ -1,154 +1,396 @@
-from bs4 import BeautifulSoup
-import markdown
+import functools
+import os
+import re
+import threading
+from html import unescape
 from typing import List, Dict, Any, Union
 
+from mistletoe import Document, block_token, span_token
+from mistletoe.base_renderer import BaseRenderer
 
-def md_to_dom(markdown_text: str) -> List[Dict[str, Any]]:
-    """Converts Markdown text to a Telegraph-compatible DOM structure.
+Node = Union[str, Dict[str, Any]]
 
-    Args:
-        markdown_text: The input Markdown text to be converted.
+# Number of distinct Markdown strings whose conversion is memoized; 0 disables.
+try:
+    _MD_CACHE_SIZE = int(os.environ.get("PH_MD_CACHE_SIZE", "256"))
+except ValueError:
+    _MD_CACHE_SIZE = 256
 
-    Returns:
-        list: A list of dictionaries representing the DOM structure.
-            Each dictionary represents a single HTML element and its
-            attributes. For example:
+# Raw HTML is split into tags and text with regular expressions; comments and
+# declarations are dropped first.
+_HTML_TAG_RE = re.compile(
+    r"<(/?)([a-zA-Z][a-zA-Z0-9]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>"
+)
+_HTML_ATTR_RE = re.compile(
+    r"([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'=<>`]+))"
+)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->|<[!?][^>]*>", re.DOTALL)
 
-            ```python
-            [
-                {
-                    "tag": "p",
-                    "children": ["This is a paragraph."]
-                },
-                {
-                    "tag": "a",
-                    "attrs": {
-                        "href": "https://example.com"
-                    },
-                    "children": ["Link text"]
-                }
-            ]
-            ```
-    """
-    html = markdown.markdown(markdown_text, extensions=["extra", "sane_lists"])
-    soup = BeautifulSoup(html, "html.parser")
-    return [parse_element(element) for element in soup.contents if element.name]
+# Tags that never have children, and the attribute kept for each tag.
+_VOID_TAGS = frozenset({"br", "hr", "img", "iframe", "video"})
+_TAG_ATTRS = {"a": "href", "img": "src", "iframe": "src", "video": "src"}
 
 
-def parse_element(element) -> Dict[str, Any]:
-    """Parses an HTML element to a Telegraph-compatible format.
+class _FlatList(list):
+    """Nodes to be spliced into the parent's children instead of nested."""
 
-    Args:
-        element: The HTML element to parse. This should be a
-            `bs4.element.Tag` object.
 
-    Returns:
-        dict: A dictionary representing the parsed element.
-            The dictionary will have a "tag" key indicating the
-            element type, and may have "attrs" and "children" keys
-            for attributes and child elements, respectively.
-    """
-    tag_dict = {"tag": element.name}
+class _OpenTag(dict):
+    """An opening raw HTML tag whose children follow as its siblings."""
+
 
-    if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-        tag_dict = handle_heading(element)
-    elif element.name in ["ul", "ol"]:
-        tag_dict = handle_list(element)
-    elif element.name == "a":
-        tag_dict = handle_link(element)
-    elif element.name in ["img", "iframe"]:
-        return handle_media(element)
-    else:
-        tag_dict["children"] = parse_children(element)
+class _CloseTag(str):
+    """A closing raw HTML tag."""
 
-    return tag_dict
 
+def _html_items(html: str, strip_text: bool) -> _FlatList:
+    """Splits raw HTML into Telegraph nodes, `_OpenTag` and `_CloseTag`.
 
-def handle_heading(element) -> Dict[str, Any]:
-    """Converts heading elements to Telegraph-compatible format.
+    Tags not in `ALLOWED_TAGS` are dropped, keeping their text.
 
     Args:
-        element: The heading element to convert.
+        html: The raw HTML.
+        strip_text: Whether to strip text between tags and drop it if blank.
 
     Returns:
-        dict: A dictionary representing the converted heading.
-            H1 and H2 headings are converted to H3 and H4
-            respectively, while other headings are converted to
-            paragraphs with strong text.
+        list: The items, to be nested by `_nest_html`.
     """
-    if element.name == "h1":
-        return {"tag": "h3", "children": parse_children(element)}
-    elif element.name == "h2":
-        return {"tag": "h4", "children": parse_children(element)}
-    else:
-        return {
-            "tag": "p",
-            "children": [{"tag": "strong", "children": parse_children(element)}],
-        }
-
-
-def handle_list(element) -> Dict[str, Any]:
-    """Converts list elements to Telegraph-compatible format.
+    items = _FlatList()
+    position = 0
+    html = _HTML_COMMENT_RE.sub("", html)
+    for match in _HTML_TAG_RE.finditer(html):
+        text = html[position : match.start()]
+        position = match.end()
+        if strip_text:
+            text = text.strip()
+        if text:
+            items.append(unescape(text))
+        tag = match.group(2).lower()
+        if tag not in ALLOWED_TAGS:
+            continue
+        if match.group(1):
+            if tag not in _VOID_TAGS:
+                items.append(_CloseTag(tag))
+            continue
+        node: Dict[str, Any] = {"tag": tag}
+        attr_name = _TAG_ATTRS.get(tag)
+        if attr_name:
+            for attr in _HTML_ATTR_RE.finditer(match.group(3)):
+                if attr.group(1).lower() == attr_name:
+                    value = next(v for v in attr.group(2, 3, 4) if v is not None)
+                    node["attrs"] = {attr_name: unescape(value)}
+                    break
+        if tag in _VOID_TAGS:
+            if tag == "br" or tag == "hr" or "attrs" in node:
+                items.append(node)
+        else:
+            items.append(_OpenTag(node))
+    text = html[position:]
+    if strip_text:
+        text = text.strip()
+    if text:
+        items.append(unescape(text))
+    return items
+
+
+def _nest_html(items: List[Any]) -> List[Node]:
+    """Moves the nodes following an `_OpenTag` into its children.
+
+    A `_CloseTag` closes the innermost open tag of the same name, and any
+    tags opened inside it; one with no matching open tag is ignored. Tags
+    left open are closed at the end.
 
     Args:
-        element: The list element to convert.
+        items: Nodes, possibly mixed with `_OpenTag` and `_CloseTag` items.
 
     Returns:
-        dict: A dictionary representing the converted list.
+        list: The nested nodes.
+    """
+    result: List[Node] = []
+    stack: List[Any] = [(None, result)]
+    for item in items:
+        item_type = type(item)
+        if item_type is _OpenTag:
+            children: List[Node] = []
+            stack[-1][1].append(dict(item, children=children))
+            stack.append((item["tag"], children))
+        elif item_type is _CloseTag:
+            for index in range(len(stack) - 1, 0, -1):
+                if stack[index][0] == item:
+                    del stack[index:]
+                    break
+        else:
+            stack[-1][1].append(item)
+    return result
+
+
+class TelegraphDomRenderer(BaseRenderer):
+    """Renders a mistletoe Markdown AST to Telegraph DOM nodes.
+
+    The AST is walked directly, without an intermediate HTML document.
+    Render methods return a node, or a `_FlatList` of nodes that is spliced
+    into the parent's children.
+
+    Raw HTML tokens are only registered with mistletoe's parser inside a
+    `with` block, so one renderer can be reused for many conversions. That
+    parser state is global, so conversions must not overlap: while one
+    runs, the tokens are also seen by other mistletoe users in the process.
+    `md_to_dom` holds a lock around each conversion.
+
+    Example:
+        >>> with TelegraphDomRenderer() as renderer:
+        ...     dom = renderer.render(Document("# Hello"))
     """
-    return {
-        "tag": element.name,
-        "children": [
-            {"tag": "li", "children": parse_children(li)}
-            for li in element.find_all("li", recursive=False)
-        ],
-    }
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.render_map["HtmlBlock"] = self.render_html_block
+        self.render_map["HtmlSpan"] = self.render_html_span
+
+    def __enter__(self) -> "TelegraphDomRenderer":
+        block_token.add_token(block_token.HtmlBlock)
+        span_token.add_token(span_token.HtmlSpan)
+        return self
+
+    def render_inner(self, token) -> List[Node]:
+        """Renders the children of a token, splicing `_FlatList` results.
+
+        Children are dispatched through `render_map` directly rather than
+        through `render`, saving a method call per child.
+
+        Args:
+            token: A token with children.
+
+        Returns:
+            list: The rendered child nodes.
+        """
+        render_map = self.render_map
+        result: List[Node] = []
+        spliced = False
+        for child in token.children:
+            rendered = render_map[child.__class__.__name__](child)
+            if type(rendered) is _FlatList:
+                result.extend(rendered)
+                spliced = True
+            else:
+                result.append(rendered)
+        # Raw inline HTML tags come as siblings of the text they enclose.
+        return _nest_html(result) if spliced else result
+
+    def render_document(self, token: block_token.Document) -> List[Node]:
+        return self.render_inner(token)
+
+    def render_raw_text(self, token: span_token.RawText) -> str:
+        return token.content
 
-def handle_link(element) -> Dict[str, Any]:
-    """Converts link elements to Telegraph-compatible format.
+    def render_escape_sequence(self, token: span_token.EscapeSequence) -> str:
+        return token.children[0].content
+
+    def render_strong(self, token: span_token.Strong) -> Dict[str, Any]:
+        return {"tag": "strong", "children": self.render_inner(token)}
+
+    def render_emphasis(self, token: span_token.Emphasis) -> Dict[str, Any]:
+        return {"tag": "em", "children": self.render_inner(token)}
+
+    def render_strikethrough(self, token: span_token.Strikethrough) -> Dict[str, Any]:
+        return {"tag": "s", "children": self.render_inner(token)}
+
+    def render_inline_code(self, token: span_token.InlineCode) -> Dict[str, Any]:
+        return {"tag": "code", "children": [token.children[0].content]}
+
+    def render_link(self, token: span_token.Link) -> Dict[str, Any]:
+        return {
+            "tag": "a",
+            "attrs": {"href": token.target},
+            "children": self.render_inner(token),
+        }
+
+    def render_auto_link(self, token: span_token.AutoLink) -> Dict[str, Any]:
+        href = f"mailto:{token.target}" if token.mailto else token.target
+        return {
+            "tag": "a",
+            "attrs": {"href": href},
+            "children": self.render_inner(token),
+        }
+
+    def render_image(self, token: span_token.Image) -> Dict[str, Any]:
+        return {"tag": "img", "attrs": {"src": token.src}}
+
+    def render_line_break(self, token: span_token.LineBreak) -> Node:
+        return "\n" if token.soft else {"tag": "br"}
+
+    def render_html_span(self, token: span_token.HtmlSpan) -> "_FlatList":
+        return _html_items(token.content, strip_text=False)
+
+    def render_html_block(self, token: block_token.HtmlBlock) -> "_FlatList":
+        return _FlatList(_nest_html(_html_items(token.content, strip_text=True)))
+
+    def render_heading(self, token: block_token.Heading) -> Dict[str, Any]:
+        """Renders a heading.
+
+        H1 and H2 headings are converted to H3 and H4 respectively, while
+        other headings are converted to paragraphs with strong text, as
+        Telegraph only supports two heading levels.
+        """
+        children = self.render_inner(token)
+        if token.level == 1:
+            return {"tag": "h3", "children": children}
+        if token.level == 2:
+            return {"tag": "h4", "children": children}
+        return {"tag": "p", "children": [{"tag": "strong", "children": children}]}
+
+    def render_paragraph(self, token: block_token.Paragraph) -> Dict[str, Any]:
+        return {"tag": "p", "children": self.render_inner(token)}
+
+    def render_quote(self, token: block_token.Quote) -> Dict[str, Any]:
+        return {"tag": "blockquote", "children": self.render_inner(token)}
+
+    def render_block_code(self, token: block_token.BlockCode) -> Dict[str, Any]:
+        code = token.children[0].content.rstrip("\n")
+        return {"tag": "pre", "children": [{"tag": "code", "children": [code]}]}
+
+    def render_list(self, token: block_token.List) -> Dict[str, Any]:
+        tag = "ul" if token.start is None else "ol"
+        return {"tag": tag, "children": self.render_inner(token)}
+
+    def render_list_item(self, token: block_token.ListItem) -> Dict[str, Any]:
+        """Renders a list item.
+
+        Paragraphs in tight lists are unwrapped, so that the item holds the
+        text directly.
+        """
+        if token.parent.loose:
+            return {"tag": "li", "children": self.render_inner(token)}
+        children: List[Node] = []
+        for child in token.children:
+            if isinstance(child, block_token.Paragraph):
+                children.extend(self.render_inner(child))
+                continue
+            rendered = self.render(child)
+            if type(rendered) is _FlatList:
+                children.extend(rendered)
+            else:
+                children.append(rendered)
+        return {"tag": "li", "children": children}
+
+    def render_thematic_break(self, token: block_token.ThematicBreak) -> Dict[str, Any]:
+        return {"tag": "hr"}
+
+    def render_table(self, token: block_token.Table) -> "_FlatList":
+        """Renders a table as one paragraph per row.
+
+        Telegraph does not support tables, so cells are separated by ' | '.
+        """
+        rows = list(token.children)
+        if hasattr(token, "header"):
+            rows.insert(0, token.header)
+        return _FlatList(self.render(row) for row in rows)
+
+    def render_table_row(self, token: block_token.TableRow) -> Dict[str, Any]:
+        children: List[Node] = []
+        for index, cell in enumerate(token.children):
+            if index:
+                children.append(" | ")
+            children.extend(self.render(cell))
+        return {"tag": "p", "children": children}
+
+    def render_table_cell(self, token: block_token.TableCell) -> List[Node]:
+        return self.render_inner(token)
+
+
+# Shared by all threads; only safe to use while holding _RENDER_LOCK. The raw
+# HTML tokens live in mistletoe's global parser state and are reset after
+# every conversion, so conversions must not overlap.
+_RENDERER = TelegraphDomRenderer()
+_RENDER_LOCK = threading.Lock()
+
+
+def _render_markdown(markdown_text: str) -> List[Dict[str, Any]]:
+    """Renders Markdown text to Telegraph DOM nodes.
 
     Args:
-        element: The link element to convert.
+        markdown_text: The input Markdown text to be converted.
 
     Returns:
-        dict: A dictionary representing the converted link.
+        list: The Telegraph DOM nodes.
     """
-    return {
-        "tag": "a",
-        "attrs": {"href": element.get("href")},
-        "children": parse_children(element),
-    }
+    with _RENDER_LOCK, _RENDERER as renderer:
+        return renderer.render(Document(markdown_text))
+
+
+# Wraps _render_markdown, so every memoized result was produced while holding
+# _RENDER_LOCK; a conversion garbled by a concurrent one is never cached.
+_cached_md_to_dom = functools.lru_cache(maxsize=max(_MD_CACHE_SIZE, 0))(
+    _render_markdown
+)
+
 
+def _copy_nodes(nodes: List[Node]) -> List[Node]:
+    """Copies Telegraph DOM nodes.
 
-def handle_media(element) -> Dict[str, Any]:
-    """Converts media elements to Telegraph-compatible format.
+    Much cheaper than `copy.deepcopy`, as nodes only hold strings, lists and
+    dictionaries of strings.
 
     Args:
-        element: The media element to convert.
+        nodes: The nodes to copy.
 
     Returns:
-        dict: A dictionary representing the converted media element.
+        list: A copy that shares no mutable objects with `nodes`.
     """
-    return {"tag": element.name, "attrs": {"src": element.get("src")}}
+    copied: List[Node] = []
+    for node in nodes:
+        if isinstance(node, str):
+            copied.append(node)
+            continue
+        node = dict(node)
+        if "attrs" in node:
+            node["attrs"] = dict(node["attrs"])
+        if "children" in node:
+            node["children"] = _copy_nodes(node["children"])
+        copied.append(node)
+    return copied
 
 
-def parse_children(element) -> List[Union[str, Dict[str, Any]]]:
-    """Parses the children of an HTML element.
+def md_to_dom(markdown_text: str) -> List[Dict[str, Any]]:
+    """Converts Markdown text to a Telegraph-compatible DOM structure.
 
     Args:
-        element: The parent HTML element.
+        markdown_text: The input Markdown text to be converted.
 
     Returns:
-        list: A list of parsed child elements. Each element in the
-            list is either a string representing text content, or
-            a dictionary representing a child element.
+        list: A list of dictionaries representing the DOM structure.
+            Each dictionary represents a single HTML element and its
+            attributes. For example:
+
+            ```python
+            [
+                {
+                    "tag": "p",
+                    "children": ["This is a paragraph."]
+                },
+                {
+                    "tag": "a",
+                    "attrs": {
+                        "href": "https://example.com"
+                    },
+                    "children": ["Link text"]
+                }
+            ]
+            ```
+
+    Note:
+        Conversions are memoized for the last `PH_MD_CACHE_SIZE` (default
+        256) distinct inputs. Each call returns a fresh copy, so the result
+        can be modified freely. Set the `PH_MD_CACHE_SIZE` environment
+        variable to 0 to disable the cache.
+
+        This function is thread-safe. Conversions run one at a time, as
+        the parser state they change is shared by the whole process, and
+        only results produced this way are memoized.
     """
-    return [
-        parse_element(child) if child.name else child.strip()
-        for child in element.children
-        if child.name or (isinstance(child, str) and child.strip())
-    ]
+    if _MD_CACHE_SIZE > 0:
+        return _copy_nodes(_cached_md_to_dom(markdown_text))
+    return _render_markdown(markdown_text)
 
 
 ALLOWED_TAGS = {